@@ -1,63 +1,92 @@
 import sys
 import os
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add project root to path (once; reruns must not grow sys.path)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 import streamlit as st
 from pathlib import Path
 
-st.set_page_config(
-    page_title="AI-Assisted Demo Video Grading - AI Video Analyzer",
-    page_icon="🎬",
-    layout="wide"
-)
+from rubric_helper import list_available_rubrics, get_rubrics_dir
 
-st.title("🎬 AI-Assisted Demo Video Grading")
-st.markdown("""
+_RESULTS_DIR = Path(__file__).parent / "results"
+
+# Resolve the Streamlit version once at import; it cannot change mid-session
+from importlib.metadata import version, PackageNotFoundError
+
+try:
+    _STREAMLIT_VERSION = version('streamlit')
+except PackageNotFoundError:
+    _STREAMLIT_VERSION = None
+
+# Static markdown hoisted to module constants so every rerun hands
+# Streamlit the same string objects instead of rebuilding the literals
+_INTRO_MD = """
     Welcome to the AI Video Analyzer - your intelligent assistant for evaluating demo videos.  
       
     Leveraging AI technology to automatically analyze demo videos with precision and consistency and generate  
     consistent, objective feedback for submitters will transform your video evaluation process.
-    """)
-
-# Key features
-st.markdown("---")
-st.subheader("✨ Key Features")
-
-col1, col2, col3 = st.columns(3)
+    """
 
-with col1:
-    st.markdown("""
+_FEATURES_MD = (
+    """
     ### 🎯 **AI-Powered Analysis**
     - Automatic translation using Whisper
     - Intelligent rubric-based evaluation
     - Consistent scoring across evaluators
     - Detailed qualitative feedback
-    """)
-
-with col2:
-    st.markdown("""
+    """,
+    """
     ### 📊 **Comprehensive Rubrics**
     - Hierarchical evaluation criteria
     - Customizable scoring systems
     - Version control and management
     - Import/export capabilities
-    """)
-
-with col3:
-    st.markdown("""
+    """,
+    """
     ### 🎬 **Video Processing**
     - Support for multiple formats (MP4, MOV, AVI, MKV)
     - URL-based video analysis
     - Progress tracking and timestamps
     - Quality metrics and insights
-    """)
+    """,
+)
 
-# Getting started section
-st.markdown("---")
-st.subheader("🎯 Getting Started")
+_FOOTER_HTML = """
+<div style='text-align: center; color: #666;'>
+    <small>
+        AI Video Analyzer - Powered by OpenAI, Anthropic, and Whisper<br>
+        Built with Streamlit • Local-first architecture for privacy
+    </small>
+</div>
+"""
+
+st.set_page_config(
+    page_title="AI-Assisted Demo Video Grading - AI Video Analyzer",
+    page_icon="🎬",
+    layout="wide"
+)
+
+st.title("🎬 AI-Assisted Demo Video Grading")
+st.markdown(_INTRO_MD)
+
+def _three_col_section(title):
+    """Render the page's repeating divider + subheader + three-column layout."""
+    st.markdown("---")
+    st.subheader(title)
+    return st.columns(3)
+
+
+# Key features
+col1, col2, col3 = _three_col_section("✨ Key Features")
 
-col1, col2, col3 = st.columns(3)
+for col, feature_md in zip((col1, col2, col3), _FEATURES_MD):
+    with col:
+        st.markdown(feature_md)
+
+# Getting started section
+col1, col2, col3 = _three_col_section("🎯 Getting Started")
 
 with col1:
     st.markdown("### 📊 Manage Rubrics")
@@ -80,51 +109,60 @@ with col3:
 st.markdown("---")
 st.subheader("📈 System Overview")
 
-# Get some basic stats
-try:
-    from rubric_helper import list_available_rubrics, get_rubrics_dir
+
+def _count_json(path: Path) -> int:
+    """Count .json files in a directory with a single scandir pass."""
+    try:
+        return sum(1 for e in os.scandir(path) if e.name.endswith('.json') and e.is_file(follow_symlinks=False))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+@st.cache_resource
+def _rubrics_dir() -> Path:
+    """Bind the rubrics directory Path once per process (no output hashing)."""
+    return get_rubrics_dir()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_rubric_stats():
+    """Gather rubric/result counts once per TTL instead of on every rerun."""
     available_rubrics = list_available_rubrics()
-    rubrics_dir = get_rubrics_dir()
-    total_files = len(list(rubrics_dir.glob("*.json"))) + len(list((rubrics_dir / "versions").glob("*.json"))) if (rubrics_dir / "versions").exists() else 0
+    rubrics_dir = _rubrics_dir()
+    total_files = _count_json(rubrics_dir) + _count_json(rubrics_dir / "versions")
 
-    col1, col2, col3 = st.columns(3)
-    # Check if analysis results directory exists and count files
-    results_dir = Path(__file__).parent / "results"
-    result_count = len(list(results_dir.glob("*.json"))) if results_dir.exists() else 0
+    # Count completed analyses in the results directory
+    result_count = _count_json(_RESULTS_DIR)
     # Calculate sample vs customized rubrics
-    sample_rubrics = [r for r in available_rubrics if r['filename'].startswith('sample')]
-    customized_count = len(available_rubrics) - len(sample_rubrics)
-    with col1:
-        st.metric("Completed Analyses", result_count)
-    with col2:
-        st.metric("Customized Rubrics", customized_count)
-    with col3:
-        st.metric("Sample Rubrics", len(sample_rubrics))
-
-except Exception as e:
-    st.info("System stats will be available once you start using the application.")
+    sample_count = sum(1 for r in available_rubrics if r['filename'].startswith('sample'))
+    customized_count = len(available_rubrics) - sample_count
+    return result_count, customized_count, sample_count
+
+
+@st.fragment
+def _render_stats():
+    """Render the stats metrics in a fragment so unrelated page reruns skip them."""
+    try:
+        result_count, customized_count, sample_count = _cached_rubric_stats()
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Completed Analyses", result_count)
+        with col2:
+            st.metric("Customized Rubrics", customized_count)
+        with col3:
+            st.metric("Sample Rubrics", sample_count)
+
+    except Exception:
+        st.info("System stats will be available once you start using the application.")
+
+
+_render_stats()
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666;'>
-    <small>
-        AI Video Analyzer - Powered by OpenAI, Anthropic, and Whisper<br>
-        Built with Streamlit • Local-first architecture for privacy
-    </small>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 # Version info
-try:
-    from importlib.metadata import version
-    streamlit_version = version('streamlit')
-    st.caption(f"Streamlit v{streamlit_version}")
-except ImportError:
-    # Fallback for older Python versions
-    try:
-        import pkg_resources
-        streamlit_version = pkg_resources.get_distribution("streamlit").version
-        st.caption(f"Streamlit v{streamlit_version}")
-    except:
-        pass
\ No newline at end of file
+if _STREAMLIT_VERSION:
+    st.caption(f"Streamlit v{_STREAMLIT_VERSION}")
\ No newline at end of file
@@ -1,16 +1,36 @@
 import sys
 import os
-# Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-# Load environment variables explicitly
-from dotenv import load_dotenv
-load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
-
+# Add project root to path (once; reruns must not grow sys.path)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Load environment variables explicitly, once per process rather than per rerun
+if not os.environ.get('_DOTENV_LOADED'):
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+    os.environ['_DOTENV_LOADED'] = '1'
+
+import queue
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 import streamlit as st
 import json
+
+# orjson parses/serializes several times faster than stdlib json; fall back
+# to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
 
 st.set_page_config(
     page_title="Analyze Video - AI Video Analyzer",
@@ -18,18 +38,26 @@ st.set_page_config(
     layout="wide"
 )
 
-# Check for dependencies
-try:
-    from src.video_evaluator import VideoEvaluator, AIProvider, list_available_rubrics, save_results
-except ImportError as e:
-    st.error("❌ Missing dependencies!")
-    st.write(f"Error: {e}")
-    st.write("")
-    st.write("To check which dependencies are missing, run:")
-    st.code("run.sh check", language="bash")
-    st.write("To install all dependencies:")
-    st.code("pip install -r requirements.txt", language="bash")
-    st.stop()
+# Importing src.video_evaluator pulls Whisper (and torch with it), which
+# dominates page cold-start. The rubric listing only needs rubric_helper, so
+# the heavy import is deferred until an analysis actually starts.
+from rubric_helper import list_available_rubrics
+
+
+def _import_evaluator():
+    """Import the evaluator module on first use, keeping the install hint."""
+    try:
+        from src.video_evaluator import VideoEvaluator, AIProvider
+        return VideoEvaluator, AIProvider
+    except ImportError as e:
+        st.error("❌ Missing dependencies!")
+        st.write(f"Error: {e}")
+        st.write("")
+        st.write("To check which dependencies are missing, run:")
+        st.code("run.sh check", language="bash")
+        st.write("To install all dependencies:")
+        st.code("pip install -r requirements.txt", language="bash")
+        st.stop()
 
 st.title('Demo Video Analyzer')
 
@@ -55,8 +83,134 @@ def save_config(config):
     except Exception as e:
         st.error(f"Failed to save configuration: {e}")
 
-# Get available rubrics (refreshed on each page load)
-available_rubrics = list_available_rubrics()
+# Precompiled visual-mismatch patterns: one regex pass instead of several
+# per-phrase substring scans over a lowercased copy
+_NO_MISMATCH_RE = re.compile(r'no (?:clear )?mismatch', re.IGNORECASE)
+_MISMATCH_RE = re.compile(
+    r'mismatch detected|does not match|not visible|inconsistent|contradiction|discrepancy',
+    re.IGNORECASE,
+)
+
+
+# Confidence bands for the score tables, highest threshold first
+_CONFIDENCE_BANDS = ((8, 'High', '🟢'), (6, 'Medium', '🟡'), (0, 'Low', '🔴'))
+
+
+def _confidence_band(value):
+    """Return the (label, emoji) band for a 0-10 confidence value."""
+    return next((label, emoji) for threshold, label, emoji in _CONFIDENCE_BANDS if value >= threshold)
+
+
+def _valid_openai_key(key) -> bool:
+    return bool(key and key.startswith('sk-') and not key.endswith('your-openai-key-here'))
+
+
+def _valid_anthropic_key(key) -> bool:
+    return bool(key and key.startswith('sk-ant-') and not key.endswith('your-anthropic-key-here'))
+
+
+@st.cache_resource(show_spinner=False)
+def _get_evaluator(rubric_path: str, provider_name: str, enable_vision: bool, translate: bool, transcription_method: str):
+    """Build (or reuse) a VideoEvaluator for this configuration.
+
+    Construction loads the Whisper model, so repeat analyses with the same
+    settings must not pay that cost again. The progress callback is attached
+    per run by the caller so it stays out of the cache key.
+    """
+    VideoEvaluator, AIProvider = _import_evaluator()
+    openai_key = os.getenv('OPENAI_API_KEY')
+    return VideoEvaluator(
+        rubric_path=rubric_path,
+        api_key=openai_key if provider_name == 'openai' else os.getenv('ANTHROPIC_API_KEY'),
+        provider=AIProvider.OPENAI if provider_name == 'openai' else AIProvider.ANTHROPIC,
+        enable_vision=enable_vision,
+        verbose=True,  # Back to normal - chunking now works properly
+        translate_to_english=translate,
+        transcription_method=transcription_method,
+        openai_api_key=openai_key  # Always pass OpenAI key for Whisper API
+    )
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _valid_url(u: str) -> bool:
+    """True when the string parses as an absolute http(s) URL."""
+    try:
+        parsed = urlparse(u)
+        return all([parsed.scheme in ['http', 'https'], parsed.netloc])
+    except Exception:
+        return False
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _key_status():
+    """Validate the provider API keys once per TTL instead of per rerun."""
+    return (
+        _valid_openai_key(os.getenv('OPENAI_API_KEY')),
+        _valid_anthropic_key(os.getenv('ANTHROPIC_API_KEY')),
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _ffmpeg_present() -> bool:
+    """Check for ffmpeg with a pure-Python PATH walk instead of forking 'which'."""
+    return shutil.which('ffmpeg') is not None
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_rubrics():
+    """Cached rubric listing so reruns skip the per-file disk scan."""
+    return list_available_rubrics()
+
+
+@st.cache_data(show_spinner=False)
+def _load_rubric(filename: str) -> dict:
+    """Load and cache a rubric JSON by filename (empty dict when unreadable)."""
+    rubric_path = Path(__file__).parent.parent / "rubrics" / f"{filename}.json"
+    try:
+        if orjson is not None:
+            return orjson.loads(rubric_path.read_bytes())
+        with open(rubric_path, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+@st.cache_data(show_spinner=False)
+def _rubric_index(filename: str):
+    """Precompute the label/weight/criteria lookup maps for a rubric.
+
+    Built once per rubric so the results view does pure dict lookups
+    instead of rebuilding the maps on every rerun.
+    """
+    rubric_data = _load_rubric(filename)
+    category_labels = {}
+    category_weights = {}
+    category_criteria = {}
+    criterion_labels = {}
+    if "categories" in rubric_data:
+        # New format: categories with nested criteria
+        for category in rubric_data["categories"]:
+            cat_id = category["category_id"]
+            category_labels[cat_id] = category["label"]
+            category_weights[cat_id] = category.get("weight", 0)
+            category_criteria[cat_id] = [c["criterion_id"] for c in category["criteria"]]
+            for criterion in category["criteria"]:
+                criterion_labels[criterion["criterion_id"]] = criterion["label"]
+    elif "criteria" in rubric_data:
+        # Old format: flat criteria
+        for criterion in rubric_data["criteria"]:
+            criterion_labels[criterion["id"]] = criterion["label"]
+    return SimpleNamespace(
+        category_labels=category_labels,
+        category_weights=category_weights,
+        category_criteria=category_criteria,
+        criterion_labels=criterion_labels,
+        is_new_format="categories" in rubric_data,
+    )
+
+
+# Get available rubrics (cache refreshes once per minute)
+available_rubrics = _list_rubrics()
 rubric_options = {r['name']: r['filename'] for r in available_rubrics}
 rubric_descriptions = {r['name']: r['description'] for r in available_rubrics}
 
@@ -135,61 +289,69 @@ if 'video_url' not in st.session_state:
 if 'score_overrides' not in st.session_state:
     st.session_state.score_overrides = {}
 
+# Check API keys once for the sidebar and the processing options below
+openai_key = os.getenv('OPENAI_API_KEY')
+anthropic_key = os.getenv('ANTHROPIC_API_KEY')
+openai_valid, anthropic_valid = _key_status()
+
+
 # Add dependency check status in sidebar
-with st.sidebar:
-    # Rubric selection (moved to top of sidebar)
-    st.subheader("⚙️ Evaluation Settings")
-    selected_rubric_name = st.selectbox(
-        'Evaluation Rubric',
-        options=list(rubric_options.keys()),
-        index=list(rubric_options.keys()).index(default_rubric_name) if default_rubric_name in rubric_options else 0,
-        help='Choose the rubric to use for evaluation'
-    )
-    if selected_rubric_name:
-        st.caption(f"📋 {rubric_descriptions[selected_rubric_name]}")
-    
-    # Button to set current selection as default
-    if selected_rubric_name and rubric_options[selected_rubric_name] != config.get('default_rubric'):
-        if st.button("Set as Default Rubric", use_container_width=True, help="Make this rubric the default for future sessions"):
-            config['default_rubric'] = rubric_options[selected_rubric_name]
-            save_config(config)
-            st.success(f"✅ '{selected_rubric_name}' is now the default rubric!")
-            st.rerun()
-    
-    provider = st.selectbox('AI Provider', ['openai','anthropic'])
+@st.fragment
+def _render_sidebar():
+    """Sidebar in its own fragment so its widget events rerun only this block.
+
+    Selections are exposed via widget keys in session state, which the main
+    script reads fresh on its next full run.
+    """
+    with st.sidebar:
+        # Rubric selection (moved to top of sidebar)
+        st.subheader("⚙️ Evaluation Settings")
+        selected = st.selectbox(
+            'Evaluation Rubric',
+            options=list(rubric_options.keys()),
+            index=list(rubric_options.keys()).index(default_rubric_name) if default_rubric_name in rubric_options else 0,
+            key='selected_rubric_name',
+            help='Choose the rubric to use for evaluation'
+        )
+        if selected:
+            st.caption(f"📋 {rubric_descriptions[selected]}")
+
+        # Button to set current selection as default
+        if selected and rubric_options[selected] != config.get('default_rubric'):
+            if st.button("Set as Default Rubric", use_container_width=True, help="Make this rubric the default for future sessions"):
+                config['default_rubric'] = rubric_options[selected]
+                save_config(config)
+                st.success(f"✅ '{selected}' is now the default rubric!")
+                st.rerun()
 
-    # System Status (moved to bottom of sidebar)
-    st.subheader("System Status")
-    
-    # Check API keys
-    openai_key = os.getenv('OPENAI_API_KEY')
-    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-    
-    # Check OpenAI key
-    if openai_key and openai_key.startswith('sk-') and not openai_key.endswith('your-openai-key-here'):
-        st.success("✓ OpenAI API key loaded")
-    else:
-        st.error("❌ OpenAI API key missing or invalid")
-    
-    # Check Anthropic key
-    if anthropic_key and anthropic_key.startswith('sk-ant-') and not anthropic_key.endswith('your-anthropic-key-here'):
-        st.success("✓ Anthropic API key loaded")
-    else:
-        st.warning("⚠️ Anthropic API key missing or invalid (optional)")
-    
-    # Quick check for ffmpeg
-    import subprocess
-    try:
-        result = subprocess.run(['which', 'ffmpeg'], capture_output=True, text=True, check=False)
-        if result.returncode == 0:
+        st.selectbox('AI Provider', ['openai','anthropic'], key='provider')
+
+        # System Status (moved to bottom of sidebar)
+        st.subheader("System Status")
+
+        # Check OpenAI key
+        if openai_valid:
+            st.success("✓ OpenAI API key loaded")
+        else:
+            st.error("❌ OpenAI API key missing or invalid")
+
+        # Check Anthropic key
+        if anthropic_valid:
+            st.success("✓ Anthropic API key loaded")
+        else:
+            st.warning("⚠️ Anthropic API key missing or invalid (optional)")
+
+        # Quick check for ffmpeg
+        if _ffmpeg_present():
             st.success("✓ ffmpeg installed")
         else:
             st.error("❌ ffmpeg not found")
             st.caption("Install with: brew install ffmpeg")
-    except:
-        st.warning("⚠️ Could not check ffmpeg")
-    
-        st.caption("Run `run.sh check` for full system check")
+
+
+_render_sidebar()
+selected_rubric_name = st.session_state.selected_rubric_name
+provider = st.session_state.provider
 
 # Submitter information - moved to top
 st.subheader("👤 Submitter Information")
@@ -260,16 +422,11 @@ else:
     
     if st.session_state.video_url:
         # Validate URL format
-        from urllib.parse import urlparse
-        try:
-            parsed = urlparse(st.session_state.video_url)
-            is_valid_url = all([parsed.scheme in ['http', 'https'], parsed.netloc])
-        except:
-            is_valid_url = False
-        
-        if not is_valid_url:
+        if not _valid_url(st.session_state.video_url):
             st.error("⚠️ Invalid URL format. Please enter a valid http:// or https:// URL.")
         else:
+            # Derive the results filename once, alongside the accepted URL
+            st.session_state.video_url_basename = os.path.basename(urlparse(st.session_state.video_url).path) or "video_from_url"
             # Only show the URL box and clear button if valid
             col1, col2 = st.columns([4, 1])
             with col1:
@@ -284,14 +441,9 @@ uploaded = st.session_state.uploaded_file
 video_url = st.session_state.video_url
 
 # Validate URL if provided
-from urllib.parse import urlparse
 url_is_valid = True
 if video_url and video_url.strip():
-    try:
-        parsed = urlparse(video_url)
-        url_is_valid = all([parsed.scheme in ['http', 'https'], parsed.netloc])
-    except:
-        url_is_valid = False
+    url_is_valid = _valid_url(video_url)
 
 # Initialize session state for analysis tracking
 if 'analyzing' not in st.session_state:
@@ -311,10 +463,7 @@ can_analyze = (uploaded is not None or (video_url and video_url.strip() and url_
 # Processing options
 st.subheader("⚙️ Processing Options")
 
-# Determine API key validity for providers
-openai_valid = bool(openai_key and openai_key.startswith('sk-') and not openai_key.endswith('your-openai-key-here'))
-anthropic_valid = bool(anthropic_key and anthropic_key.startswith('sk-ant-') and not anthropic_key.endswith('your-anthropic-key-here'))
-
+# API key validity comes from the cached sidebar check
 # Gate OpenAI API option on valid OpenAI key (only OpenAI has Whisper API)
 openai_api_enabled = openai_valid
 
@@ -363,22 +512,27 @@ if st.session_state.start_analysis:
     
     tmp = None
     try:
-        prov = AIProvider.OPENAI if provider == 'openai' else AIProvider.ANTHROPIC
         rubric_filename = rubric_options[selected_rubric_name]
-        
+        # Remember which rubric produced these results so the results view
+        # renders with the right format even if the sidebar selection changes
+        st.session_state.analysis_rubric_filename = rubric_filename
+
         # Map friendly name to internal value - "OpenAI Whisper API" uses openai for transcription, "Local Whisper model" uses local
         method_internal = "openai" if transcription_method == "OpenAI Whisper API" else "local"
         
-        # Progress callback that prints to terminal (stdout)
-        def progress_callback(message: str):
-            print(message, flush=True)
-        
         # Show progress with status updates
         progress_placeholder = st.empty()
         status_placeholder = st.empty()
-        
-        # Progress callback that updates the UI in real-time
+
+        # Worker-thread callback: enqueue only, the main thread does the
+        # Streamlit writes so the pipeline never blocks on UI round-trips
+        progress_queue = queue.Queue()
+
         def ui_progress_callback(message: str):
+            progress_queue.put(message)
+
+        # Render a progress message in the UI (main thread only)
+        def _render_progress(message: str):
             # Map internal progress messages to UI step numbers
             if "Downloading from URL" in message:
                 progress_placeholder.write("⏳ **Step 1/4:** Downloading video/audio...")
@@ -401,39 +555,45 @@ if st.session_state.start_analysis:
             # Also print to terminal for debugging
             print(message, flush=True)
         
-        evaluator = VideoEvaluator(
-            rubric_path=rubric_filename,
-            api_key=openai_key if provider == 'openai' else anthropic_key,
-            provider=prov, 
-            enable_vision=vision, 
-            verbose=True,  # Back to normal - chunking now works properly
-            progress_callback=ui_progress_callback,
-            translate_to_english=translate,
-            transcription_method=method_internal,
-            openai_api_key=openai_key  # Always pass OpenAI key for Whisper API
-        )
-        
+        evaluator = _get_evaluator(rubric_filename, provider, vision, translate, method_internal)
+        evaluator.progress_callback = ui_progress_callback
+
         with status_placeholder.container():
             progress_placeholder.write("⏳ **Step 1/4:** Preparing audio...")
             progress_placeholder.caption("This may take a few minutes, depending on audio/video length")
-            
+
             # Process based on input type
             if uploaded:
                 # File upload - save to temp
-                tmp = f"/tmp/{uploaded.name}"
-                with open(tmp, 'wb') as f:
-                    f.write(uploaded.getbuffer())
-                res = evaluator.process(tmp, is_url=False, enable_vision=vision)
+                # Unique temp file (RAM-backed /dev/shm when available) instead of
+                # a hardcoded /tmp path that races across concurrent sessions
+                tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+                uploaded.seek(0)
+                with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=Path(uploaded.name).suffix, delete=False) as f:
+                    tmp = f.name
+                    # Stream in 1 MiB chunks; getbuffer() would hold a full copy in RAM
+                    shutil.copyfileobj(uploaded, f, length=1024 * 1024)
+                source, is_url = tmp, False
                 original_filename = uploaded.name
             else:
                 # URL - process directly
-                res = evaluator.process(video_url, is_url=True, enable_vision=vision)
-                # Extract filename from URL for results saving
-                from urllib.parse import urlparse
-                import os
-                parsed_url = urlparse(video_url)
-                original_filename = os.path.basename(parsed_url.path) or "video_from_url"
-            
+                source, is_url = video_url, True
+                # Results filename was derived when the URL was accepted
+                original_filename = st.session_state.get('video_url_basename', 'video_from_url')
+
+            # Run the pipeline off the UI thread and drain progress messages
+            # from the main thread so evaluator.process runs at full speed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(evaluator.process, source, is_url=is_url, enable_vision=vision)
+                while not future.done():
+                    try:
+                        _render_progress(progress_queue.get(timeout=0.1))
+                    except queue.Empty:
+                        pass
+                while not progress_queue.empty():
+                    _render_progress(progress_queue.get_nowait())
+                res = future.result()
+
             # Print completion to terminal
             print("✅ Analysis complete!", flush=True)
             print("", flush=True)
@@ -548,23 +708,12 @@ if st.session_state.analysis_results is not None:
         # Visual Analysis (if enabled) - placed right after transcription quality
         if res.get('visual_analysis'):
             visual_text = res.get('visual_analysis', '')
-            # Determine if mismatches were detected
-            visual_lower = visual_text.lower()
-            
             # If text contains "no mismatch" or "no clear mismatch", it's clean
             # Otherwise look for problem indicators
-            if 'no mismatch' in visual_lower or 'no clear mismatch' in visual_lower:
+            if _NO_MISMATCH_RE.search(visual_text):
                 has_mismatch = False
             else:
-                # Look for actual problem indicators
-                has_mismatch = any(phrase in visual_lower for phrase in [
-                    'mismatch detected',
-                    'does not match',
-                    'not visible',
-                    'inconsistent',
-                    'contradiction',
-                    'discrepancy'
-                ])
+                has_mismatch = bool(_MISMATCH_RE.search(visual_text))
             
             status_message = "Mismatches detected" if has_mismatch else "No mismatches detected"
             
@@ -576,8 +725,14 @@ if st.session_state.analysis_results is not None:
         evaluation = res.get('evaluation', {})
         overall = evaluation.get('overall', {})
         
-        # Check if using new rubric format (has categories)
-        is_new_format = 'categories' in evaluation
+        # Drive the display off the rubric the stored results were produced
+        # with, not the current sidebar selection - switching to a
+        # differently-formatted rubric must not re-render old results under
+        # the wrong format. Format comes from the cached index; no JSON I/O
+        # in the render path.
+        results_rubric_filename = st.session_state.get(
+            'analysis_rubric_filename', rubric_options[selected_rubric_name])
+        is_new_format = _rubric_index(results_rubric_filename).is_new_format
         
         col1, col2 = st.columns(2)
         with col1:
@@ -596,48 +751,22 @@ if st.session_state.analysis_results is not None:
         
         # Display category scores for new format
         if is_new_format and 'categories' in evaluation:
-            # Load the rubric to get proper labels
-            rubric_filename = rubric_options[selected_rubric_name]
-            rubric_path = Path(__file__).parent.parent / "rubrics" / f"{rubric_filename}.json"
-            rubric_data = {}
-            try:
-                with open(rubric_path, 'r') as f:
-                    rubric_data = json.load(f)
-            except:
-                pass
-            
-            # Create category label mapping
-            category_labels = {}
-            category_weights = {}
-            if rubric_data and "categories" in rubric_data:
-                for category in rubric_data["categories"]:
-                    category_labels[category["category_id"]] = category["label"]
-                    category_weights[category["category_id"]] = category.get("weight", 0)
-            
+            # Load the precomputed lookup maps for the analyzed rubric
+            idx = _rubric_index(results_rubric_filename)
+            category_labels = idx.category_labels
+            category_weights = idx.category_weights
+
             st.markdown("### 📂 Category Breakdown")
-            categories = evaluation.get('categories', {})
-            scores = evaluation.get('scores', {})
+            categories = evaluation.get('categories') or {}
+            scores = evaluation.get('scores') or {}
             
             # Check if any scores are fallback (heuristic) and show prominent warning
             fallback_criteria = []
             
-            # Create criterion label mapping for fallback detection
-            temp_criterion_labels = {}
-            if rubric_data:
-                if "categories" in rubric_data:
-                    # New format
-                    for category in rubric_data["categories"]:
-                        for criterion in category["criteria"]:
-                            temp_criterion_labels[criterion["criterion_id"]] = criterion["label"]
-                else:
-                    # Old format
-                    for criterion in rubric_data["criteria"]:
-                        temp_criterion_labels[criterion["id"]] = criterion["label"]
-            
             for criterion_id, data in scores.items():
                 note = data.get('note', '')
                 if 'Auto-generated conservative score' in note:
-                    fallback_criteria.append(temp_criterion_labels.get(criterion_id, criterion_id))
+                    fallback_criteria.append(idx.criterion_labels.get(criterion_id, criterion_id))
             
             if fallback_criteria:
                 st.error("🚨 **AI Evaluation Failed** - Using Conservative Fallback Scores")
@@ -645,25 +774,12 @@ if st.session_state.analysis_results is not None:
                 st.info(f"**Affected criteria:** {', '.join(fallback_criteria)}")
                 st.markdown("---")
             
-            # Create mapping of criteria to categories
-            category_criteria = {}
-            if rubric_data and "categories" in rubric_data:
-                for category in rubric_data["categories"]:
-                    category_criteria[category["category_id"]] = [
-                        criterion["criterion_id"] for criterion in category["criteria"]
-                    ]
-            
-            # Create table headers
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                st.markdown("**Name**")
-            with col2:
-                st.markdown("**Score**")
-            with col3:
-                st.markdown("**Weight**")
-            with col4:
-                st.markdown("**Confidence**")
-            
+            # Mapping of criteria to categories comes from the cached index
+            category_criteria = idx.category_criteria
+
+            # Build the rows in Python and render one dataframe instead of
+            # emitting per-row column widgets
+            category_rows = []
             for cat_id, cat_data in categories.items():
                 cat_name = category_labels.get(cat_id, cat_id.replace('_', ' ').title())
                 points = cat_data.get('points', 0)
@@ -672,26 +788,19 @@ if st.session_state.analysis_results is not None:
                 weight = category_weights.get(cat_id, 0)
                 
                 # Calculate average confidence for this category
-                category_confidences = []
-                if cat_id in category_criteria:
-                    for criterion_id in category_criteria[cat_id]:
-                        if criterion_id in scores:
-                            confidence = scores[criterion_id].get('confidence')
-                            if isinstance(confidence, int):
-                                category_confidences.append(confidence)
-                
+                category_confidences = [
+                    c for c in (scores.get(cid, {}).get('confidence') for cid in category_criteria.get(cat_id, ()))
+                    if isinstance(c, int)
+                ]
+
                 avg_confidence = None
                 if category_confidences:
                     avg_confidence = sum(category_confidences) / len(category_confidences)
                 
                 # Determine confidence text label (High/Medium/Low)
                 if avg_confidence is not None:
-                    if avg_confidence >= 8:
-                        confidence_display = f"High ({avg_confidence:.1f}/10)"
-                    elif avg_confidence >= 6:
-                        confidence_display = f"Medium ({avg_confidence:.1f}/10)"
-                    else:
-                        confidence_display = f"Low ({avg_confidence:.1f}/10)"
+                    band_label, _ = _confidence_band(avg_confidence)
+                    confidence_display = f"{band_label} ({avg_confidence:.1f}/10)"
                 else:
                     confidence_display = "N/A"
                 
@@ -703,15 +812,14 @@ if st.session_state.analysis_results is not None:
                 else:
                     score_icon = "🔴"
                 
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                with col1:
-                    st.markdown(f"**{cat_name}**")
-                with col2:
-                    st.markdown(f"{score_icon} **{points}/{max_points}** ({percentage:.1f}%)")
-                with col3:
-                    st.markdown(f"**{weight:.1f}**")
-                with col4:
-                    st.markdown(confidence_display)
+                category_rows.append({
+                    'Name': cat_name,
+                    'Score': f"{score_icon} {points}/{max_points} ({percentage:.1f}%)",
+                    'Weight': f"{weight:.1f}",
+                    'Confidence': confidence_display,
+                })
+
+            st.dataframe(pd.DataFrame(category_rows), use_container_width=True, hide_index=True)
         
         # Display qualitative feedback
         feedback = res.get('feedback')
@@ -752,44 +860,12 @@ if st.session_state.analysis_results is not None:
         # Display detailed scores table
         scores = evaluation.get('scores', {})
         if scores:
-            # Load the rubric to get proper labels
-            rubric_filename = rubric_options[selected_rubric_name]
-            rubric_path = Path(__file__).parent.parent / "rubrics" / f"{rubric_filename}.json"
-            rubric_data = {}
-            try:
-                with open(rubric_path, 'r') as f:
-                    rubric_data = json.load(f)
-            except:
-                pass
-            
-            # Create criterion label mapping
-            criterion_labels = {}
-            if rubric_data:
-                if "categories" in rubric_data:
-                    # New format
-                    for category in rubric_data["categories"]:
-                        for criterion in category["criteria"]:
-                            criterion_labels[criterion["criterion_id"]] = criterion["label"]
-                else:
-                    # Old format
-                    for criterion in rubric_data["criteria"]:
-                        criterion_labels[criterion["id"]] = criterion["label"]
-            
+            # Criterion labels come from the cached index of the analyzed rubric
+            criterion_labels = _rubric_index(results_rubric_filename).criterion_labels
+
             with st.expander("### 📋 Detailed Criteria Scores", expanded=False):
-                # Create table headers
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
-                with col1:
-                    st.markdown("**Criterion**")
-                with col2:
-                    st.markdown("**Score**")
-                with col3:
-                    st.markdown("**Confidence**")
-                with col4:
-                    st.markdown("**Notes**")
-                
-                st.markdown("---")  # Divider line
-                
-                # Display each criterion in table format
+                # Collect each criterion as a row and render one dataframe
+                criteria_rows = []
                 for criterion_id, data in scores.items():
                     criterion_name = criterion_labels.get(criterion_id, criterion_id.replace('_', ' ').title())
                     original_score = data.get('score', 'N/A')
@@ -801,60 +877,63 @@ if st.session_state.analysis_results is not None:
                         score_display_base = f"{score}"
                         if not is_new_format:
                             score_display_base += "/10"
-                        score_display = f"**{score_display_base}** ⚠️ (Overridden from {original_score})"
+                        score_display = f"{score_display_base} ⚠️ (Overridden from {original_score})"
                     else:
                         score = original_score
                         # Determine max score based on rubric format
                         if is_new_format:
-                            score_display = f"**{score}**"
+                            score_display = f"{score}"
                         else:
-                            score_display = f"**{score}/10**"
+                            score_display = f"{score}/10"
                     
                     confidence = data.get('confidence', 'N/A')
                     note = data.get('note', '')
                     
                     # Determine confidence level and color
                     if isinstance(confidence, int):
-                        if confidence >= 8:
-                            confidence_display = f"🟢 {confidence}/10"
-                        elif confidence >= 6:
-                            confidence_display = f"🟡 {confidence}/10"
-                        else:
-                            confidence_display = f"🔴 {confidence}/10"
+                        _, band_emoji = _confidence_band(confidence)
+                        confidence_display = f"{band_emoji} {confidence}/10"
                     else:
                         confidence_display = "N/A"
                     
-                    # Use columns for table-like display
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 2])
-                    with col1:
-                        st.markdown(f"**{criterion_name}**")
-                    with col2:
-                        st.markdown(score_display)
-                    with col3:
-                        st.markdown(confidence_display)
-                    with col4:
-                        st.caption(note if note else "—")
+                    criteria_rows.append({
+                        'Criterion': criterion_name,
+                        'Score': score_display,
+                        'Confidence': confidence_display,
+                        'Notes': note if note else "—",
+                    })
+
+                st.dataframe(pd.DataFrame(criteria_rows), use_container_width=True, hide_index=True)
 
         st.subheader('Transcript')
         with st.expander("**View Full Transcript**", expanded=False):
             st.text(res.get('transcript', ''))
 
         with st.expander("**View Full JSON Results**", expanded=False):
-            st.json(res)
+            # The JSON tree widget is heavy for large results; only build it
+            # when explicitly requested
+            if st.checkbox("Load full JSON view", value=False):
+                st.json(res)
         
-        # Save results to file with new naming format
-        from datetime import datetime
+        # Save results to file with new naming format; serialize once and
+        # reuse the string for both the saved file and the download button
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         result_filename = f"{first_name.strip()}_{last_name.strip()}_{partner_name.strip()}_{timestamp}"
-        saved_json_path = save_results(res, result_filename, output_format='json')
-        
+        if orjson is not None:
+            json_content = orjson.dumps(res, option=orjson.OPT_INDENT_2).decode()
+        else:
+            json_content = json.dumps(res, indent=2)
+        results_dir = Path(__file__).parent.parent / "results"
+        results_dir.mkdir(exist_ok=True)
+        saved_json_path = results_dir / f"{result_filename}.json"
+        saved_json_path.write_text(json_content)
+
         # Show success message and provide download button
         st.success(f"💾 Results saved to `results/` folder")
-        
+
         # Create centered download button for JSON version
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            json_content = json.dumps(res, indent=2)
             st.download_button(
                 label="📄 Download JSON Report",
                 data=json_content,
@@ -1,13 +1,21 @@
 import sys
 import os
-import requests
+import asyncio
+import httpx
+import hashlib
 import json
+import re
+from collections import OrderedDict
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import streamlit as st
 from pathlib import Path
-from validation_ui import validate_and_display
+from validation_ui import display_validation_results
 from rubric_helper import (
     list_available_rubrics, save_rubric_to_file, validate_rubric
 )
@@ -21,6 +29,61 @@ st.set_page_config(
 st.title("📥 Import Rubric")
 st.markdown("Import evaluation rubrics from JSON files. Supports both local files and URLs.")
 
+
+# Filename sanitization/validation regexes, compiled once: a single C-level
+# pass per rerun instead of chained replace() scans
+_SANITIZE_RE = re.compile(r'[^a-z0-9_]+')
+_VALID_FILENAME_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+
+def _validate_cached(data):
+    """Validate a rubric dict, memoized by content hash in session state.
+
+    Reruns hand us the same dict on every widget interaction; hashing a
+    canonical serialization lets us skip the full criteria traversal when
+    nothing changed. Keeps a small LRU so stale uploads age out.
+    """
+    serialized = (orjson.dumps(data, option=orjson.OPT_SORT_KEYS) if orjson is not None
+                  else json.dumps(data, sort_keys=True).encode())
+    key = hashlib.sha256(serialized).hexdigest()
+    cache = st.session_state.setdefault('_rubric_val_cache', OrderedDict())
+    if key in cache:
+        cache.move_to_end(key)
+    else:
+        cache[key] = validate_rubric(data)
+        if len(cache) > 8:
+            cache.popitem(last=False)
+    return cache[key]
+
+
+# Hard cap on fetched rubric size; a huge or malicious response must not
+# be buffered wholesale into the worker's memory
+_MAX_RUBRIC_BYTES = 10 * 1024 * 1024
+
+
+async def _fetch_url(url: str) -> bytes:
+    """Stream rubric bytes over async httpx, bounded by _MAX_RUBRIC_BYTES."""
+    async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('content-type', '')
+            if 'html' in content_type:
+                raise ValueError(f"URL returned '{content_type}', not JSON - check the link points at a raw file")
+            total = 0
+            chunks = []
+            async for chunk in response.aiter_bytes(65536):
+                total += len(chunk)
+                if total > _MAX_RUBRIC_BYTES:
+                    raise ValueError("Rubric too large (>10MB)")
+                chunks.append(chunk)
+            return b''.join(chunks)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_rubrics():
+    """List available rubrics once per TTL instead of on every keystroke rerun."""
+    return list_available_rubrics()
+
 # Import method selection
 import_method = st.radio(
     "",
@@ -42,7 +105,18 @@ if import_method == "Upload Local File":
 
     if uploaded_file is not None:
         try:
-            rubric_data = json.load(uploaded_file)
+            # file_uploader returns a fresh object per rerun even for identical
+            # contents; key the parse on a content hash to skip re-decoding
+            raw = uploaded_file.getvalue()
+            upload_key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            upload_cache = st.session_state.setdefault('_upload_cache', OrderedDict())
+            if upload_key in upload_cache:
+                upload_cache.move_to_end(upload_key)
+            else:
+                upload_cache[upload_key] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if len(upload_cache) > 4:
+                    upload_cache.popitem(last=False)
+            rubric_data = upload_cache[upload_key]
             source_info = f"Local file: {uploaded_file.name}"
         except json.JSONDecodeError as e:
             import_error = f"Invalid JSON file: {e}"
@@ -63,14 +137,15 @@ elif import_method == "Import from URL":
         else:
             try:
                 with st.spinner("Fetching rubric from URL..."):
-                    response = requests.get(url, timeout=10)
-                    response.raise_for_status()
-                    rubric_data = response.json()
+                    raw = asyncio.run(_fetch_url(url))
+                    rubric_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     source_info = f"URL: {url}"
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 import_error = f"Error fetching URL: {e}"
             except json.JSONDecodeError as e:
                 import_error = f"Invalid JSON from URL: {e}"
+            except ValueError as e:
+                import_error = f"Error fetching URL: {e}"
             except Exception as e:
                 import_error = f"Unexpected error: {e}"
 
@@ -93,7 +168,9 @@ elif rubric_data:
 
     # Validate the imported rubric
     st.markdown("### 🔍 Validation")
-    is_valid = validate_and_display(rubric_data, rubric_data.get('name', 'Imported Rubric'), mode="full")
+    is_valid, error_msg = _validate_cached(rubric_data)
+    display_validation_results(is_valid, error_msg, rubric_data, mode="full",
+                               rubric_name=rubric_data.get('name', 'Imported Rubric'))
 
     if is_valid:
         # Import options
@@ -101,12 +178,14 @@ elif rubric_data:
 
         # Generate suggested filename
         rubric_name = rubric_data.get('name', 'imported_rubric')
-        suggested_filename = rubric_name.lower().replace(' ', '_').replace('-', '_')
-        suggested_filename = ''.join(c for c in suggested_filename if c.isalnum() or c == '_')
+        suggested_filename = _SANITIZE_RE.sub('', rubric_name.lower().replace(' ', '_').replace('-', '_'))
 
-        # Check for existing rubrics
-        existing_rubrics = list_available_rubrics()
-        existing_names = [r['filename'] for r in existing_rubrics]
+        # Collision check against a frozenset built once per session: O(1)
+        # membership and no disk scan on keystroke reruns
+        existing_names = st.session_state.get('_rubric_filenames')
+        if existing_names is None:
+            existing_names = frozenset(r['filename'] for r in _cached_rubrics())
+            st.session_state['_rubric_filenames'] = existing_names
 
         col1, col2 = st.columns([2, 1])
         with col1:
@@ -131,7 +210,7 @@ elif rubric_data:
         elif filename in existing_names and not overwrite:
             filename_valid = False
             filename_error = "Filename already exists. Check 'Overwrite' to replace it."
-        elif not filename.replace('_', '').replace('-', '').isalnum():
+        elif not _VALID_FILENAME_RE.fullmatch(filename):
             filename_valid = False
             filename_error = "Filename can only contain letters, numbers, underscores, and hyphens"
 
@@ -142,6 +221,8 @@ elif rubric_data:
         if st.button("📥 Import Rubric", use_container_width=True, type="primary", disabled=not filename_valid):
             success, error = save_rubric_to_file(rubric_data, filename, create_backup=overwrite)
             if success:
+                _cached_rubrics.clear()  # the listing just changed on disk
+                st.session_state['_rubric_filenames'] = existing_names | {filename}
                 st.success(f"✅ Rubric '{rubric_data.get('name', filename)}' imported successfully!")
                 st.info(f"**Filename:** {filename}.json")
                 st.info("Switch to the **'📋 View Rubrics'** page to see your imported rubric.")
@@ -156,9 +237,15 @@ elif rubric_data:
     else:
         st.warning("⚠️ The imported rubric has validation errors. You can still import it, but it may not work correctly with the evaluation system.")
 
-# Help section
-with st.expander("ℹ️ Import Help"):
-    st.markdown("""
+# Help section (static content; the fragment keeps widget reruns from
+# re-rendering it)
+@st.fragment
+def _render_help():
+    with st.expander("ℹ️ Import Help"):
+        st.markdown(_HELP_MD)
+
+
+_HELP_MD = """
     **Supported Rubric Formats:**
 
     **Hierarchical Format (Recommended):**
@@ -198,7 +285,9 @@ with st.expander("ℹ️ Import Help"):
     - Filenames should be unique and contain only letters, numbers, underscores, and hyphens
     - Imported rubrics are automatically validated
     - You can overwrite existing rubrics by checking the overwrite option
-    """)
+    """
+
+_render_help()
 
 # Navigation
 st.markdown("---")
@@ -6,7 +6,13 @@ import streamlit as st
 
 st.set_page_config(page_title="Documentation", page_icon="📚")
 
-st.title("📚 Documentation")
-st.write("Access the project documentation below:")
 
-st.page_link("https://github.com/dsmilne3/ai-video-analyzer", label="📖 Open Documentation", icon="🔗")
\ No newline at end of file
+@st.fragment
+def _render_docs():
+    """Static page body; the fragment keeps widget reruns from re-executing it."""
+    st.title("📚 Documentation")
+    st.write("Access the project documentation below:")
+    st.page_link("https://github.com/dsmilne3/ai-video-analyzer", label="📖 Open Documentation", icon="🔗")
+
+
+_render_docs()
\ No newline at end of file
@@ -42,12 +42,103 @@ Examples:
     python rubric_helper.py restore sales-demo 1.0
 """
 
+import argparse
+import hashlib
 import json
 import os
+import re
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, Tuple, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, preferring orjson's C parser when installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    """Serialize to 2-space-indented JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _canonical(obj: Dict[str, Any]) -> bytes:
+    """Key-sorted JSON bytes, used to fingerprint a rubric's content."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+def _ask(prompt: str = "") -> str:
+    """Prompt replacement for piped stdin: write the prompt, read one line.
+
+    Skips the readline setup and terminal bookkeeping the builtin input()
+    performs per call, which is pure overhead when the CLI is driven from
+    a script or CI pipe.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+# When stdin is not a terminal, shadow input() module-wide so every
+# interactive prompt below goes through the lighter readline-free path
+if not sys.stdin.isatty():
+    input = _ask
+
+
+# Compiled backup-filename matchers per rubric, built on first use
+_VERSION_RE_CACHE: Dict[str, "re.Pattern"] = {}
+
+
+def _version_pattern(filename: str) -> "re.Pattern":
+    """Compiled matcher for '{filename}.v{major}.{minor}.{timestamp}.json'."""
+    pattern = _VERSION_RE_CACHE.get(filename)
+    if pattern is None:
+        pattern = _VERSION_RE_CACHE[filename] = re.compile(
+            rf"^{re.escape(filename)}\.v(\d+)\.(\d+)\.(.+)\.json$"
+        )
+    return pattern
+
+
+# Matches the serialized "status" field for in-place byte patching on restore
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"[^"]*"')
+
+
+# Required-key sets for validation, hoisted so each call loads a constant
+# instead of rebuilding the set literals
+_REQ_TOP_NEW = frozenset({"categories", "scale", "overall_method", "thresholds"})
+_REQ_TOP_OLD = frozenset({"criteria", "scale", "overall_method", "thresholds"})
+_REQ_CATEGORY = frozenset({"category_id", "label", "weight", "max_points", "criteria"})
+_REQ_CRITERION = frozenset({"criterion_id", "label", "desc", "max_points"})
+_REQ_OLD_CRITERION = frozenset({"id", "label", "desc", "weight"})
+
+
+# Validation results keyed by a content hash of the raw JSON bytes, so
+# repeated list/show/edit calls within one process only re-validate files
+# whose bytes actually changed
+_VALIDATION_CACHE: Dict[bytes, Tuple[bool, Optional[str]]] = {}
+
+
+def _validate_raw(raw: bytes, rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """validate_rubric memoized on the raw file bytes."""
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    result = _VALIDATION_CACHE.get(key)
+    if result is None:
+        result = _VALIDATION_CACHE[key] = validate_rubric(rubric)
+    return result
+
 
 def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -58,127 +149,138 @@ def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         Tuple of (True, None) if valid, or (False, error_message) if invalid
     """
     # Check if this is new format (categories) or old format (criteria)
-    is_new_format = "categories" in rubric
-    is_old_format = "criteria" in rubric
-
-    if not is_new_format and not is_old_format:
+    if "categories" in rubric:
+        format_validator = _validate_new_format
+    elif "criteria" in rubric:
+        format_validator = _validate_old_format
+    else:
         return False, "Rubric must have either 'categories' (new format) or 'criteria' (old format)"
 
-    if is_new_format:
-        # Validate new hierarchical format
-        required_keys = {"categories", "scale", "overall_method", "thresholds"}
-        if not all(key in rubric for key in required_keys):
-            missing = required_keys - set(rubric.keys())
-            return False, f"Missing required keys: {missing}"
+    is_valid, error = format_validator(rubric)
+    if not is_valid:
+        return is_valid, error
 
-        # Validate categories
-        if not isinstance(rubric["categories"], list) or len(rubric["categories"]) == 0:
-            return False, "categories must be a non-empty list"
+    return _validate_scale_and_thresholds(rubric)
 
-        seen_cat_ids = set()
-        total_weight = 0.0
-        for i, category in enumerate(rubric["categories"]):
-            # Check required fields
-            required_fields = {"category_id", "label", "weight", "max_points", "criteria"}
-            if not all(field in category for field in required_fields):
-                missing = required_fields - set(category.keys())
-                return False, f"Category {i} missing required fields: {missing}"
 
-            # Check for duplicate category IDs
-            if category["category_id"] in seen_cat_ids:
-                return False, f"Duplicate category ID: {category['category_id']}"
-            seen_cat_ids.add(category["category_id"])
+def _validate_new_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate the hierarchical (categories) portion of a rubric."""
+    if not _REQ_TOP_NEW.issubset(rubric.keys()):
+        missing = _REQ_TOP_NEW - rubric.keys()
+        return False, f"Missing required keys: {missing}"
 
-            # Check weight is a number
-            try:
-                weight = float(category["weight"])
-                if weight < 0 or weight > 1:
-                    return False, f"Category '{category['category_id']}' weight must be between 0 and 1"
-                total_weight += weight
-            except (TypeError, ValueError):
-                return False, f"Category '{category['category_id']}' weight must be a number"
+    # Validate categories
+    if not isinstance(rubric["categories"], list) or len(rubric["categories"]) == 0:
+        return False, "categories must be a non-empty list"
+
+    seen_cat_ids = set()
+    total_weight = 0.0
+    for i, category in enumerate(rubric["categories"]):
+        # Check required fields (one subset test instead of a per-field scan)
+        if not _REQ_CATEGORY.issubset(category.keys()):
+            missing = _REQ_CATEGORY - category.keys()
+            return False, f"Category {i} missing required fields: {missing}"
+
+        # Check for duplicate category IDs
+        if category["category_id"] in seen_cat_ids:
+            return False, f"Duplicate category ID: {category['category_id']}"
+        seen_cat_ids.add(category["category_id"])
+
+        # Check weight is a number
+        try:
+            weight = float(category["weight"])
+            if weight < 0 or weight > 1:
+                return False, f"Category '{category['category_id']}' weight must be between 0 and 1"
+            total_weight += weight
+        except (TypeError, ValueError):
+            return False, f"Category '{category['category_id']}' weight must be a number"
+
+        # Check max_points is positive
+        try:
+            max_points = int(category["max_points"])
+            if max_points <= 0:
+                return False, f"Category '{category['category_id']}' max_points must be positive"
+        except (TypeError, ValueError):
+            return False, f"Category '{category['category_id']}' max_points must be a positive integer"
+
+        # Validate criteria within category
+        if not isinstance(category["criteria"], list) or len(category["criteria"]) == 0:
+            return False, f"Category '{category['category_id']}' criteria must be a non-empty list"
+
+        seen_crit_ids = set()
+        category_points = 0
+        for j, criterion in enumerate(category["criteria"]):
+            # Check required fields
+            if not _REQ_CRITERION.issubset(criterion.keys()):
+                missing = _REQ_CRITERION - criterion.keys()
+                return False, f"Category '{category['category_id']}' criterion {j} missing required fields: {missing}"
+
+            # Check for duplicate criterion IDs within category
+            if criterion["criterion_id"] in seen_crit_ids:
+                return False, f"Duplicate criterion ID in category '{category['category_id']}': {criterion['criterion_id']}"
+            seen_crit_ids.add(criterion["criterion_id"])
 
             # Check max_points is positive
             try:
-                max_points = int(category["max_points"])
-                if max_points <= 0:
-                    return False, f"Category '{category['category_id']}' max_points must be positive"
+                crit_max_points = int(criterion["max_points"])
+                if crit_max_points <= 0:
+                    return False, f"Criterion '{criterion['criterion_id']}' max_points must be positive"
+                category_points += crit_max_points
             except (TypeError, ValueError):
-                return False, f"Category '{category['category_id']}' max_points must be a positive integer"
-
-            # Validate criteria within category
-            if not isinstance(category["criteria"], list) or len(category["criteria"]) == 0:
-                return False, f"Category '{category['category_id']}' criteria must be a non-empty list"
-
-            seen_crit_ids = set()
-            category_points = 0
-            for j, criterion in enumerate(category["criteria"]):
-                # Check required fields
-                required_crit_fields = {"criterion_id", "label", "desc", "max_points"}
-                if not all(field in criterion for field in required_crit_fields):
-                    missing = required_crit_fields - set(criterion.keys())
-                    return False, f"Category '{category['category_id']}' criterion {j} missing required fields: {missing}"
-
-                # Check for duplicate criterion IDs within category
-                if criterion["criterion_id"] in seen_crit_ids:
-                    return False, f"Duplicate criterion ID in category '{category['category_id']}': {criterion['criterion_id']}"
-                seen_crit_ids.add(criterion["criterion_id"])
-
-                # Check max_points is positive
-                try:
-                    crit_max_points = int(criterion["max_points"])
-                    if crit_max_points <= 0:
-                        return False, f"Criterion '{criterion['criterion_id']}' max_points must be positive"
-                    category_points += crit_max_points
-                except (TypeError, ValueError):
-                    return False, f"Criterion '{criterion['criterion_id']}' max_points must be a positive integer"
+                return False, f"Criterion '{criterion['criterion_id']}' max_points must be a positive integer"
 
-            # Check category points match sum of criteria points
-            if category_points != category["max_points"]:
-                return False, f"Category '{category['category_id']}' max_points ({category['max_points']}) doesn't match sum of criteria points ({category_points})"
+        # Check category points match sum of criteria points
+        if category_points != category["max_points"]:
+            return False, f"Category '{category['category_id']}' max_points ({category['max_points']}) doesn't match sum of criteria points ({category_points})"
 
-        # Check category weights sum to approximately 1.0
-        if not (0.99 <= total_weight <= 1.01):
-            return False, f"Category weights must sum to 1.0 (current sum: {total_weight:.4f})"
+    # Check category weights sum to approximately 1.0
+    if not (0.99 <= total_weight <= 1.01):
+        return False, f"Category weights must sum to 1.0 (current sum: {total_weight:.4f})"
 
-    else:
-        # Validate old flat format
-        required_keys = {"criteria", "scale", "overall_method", "thresholds"}
-        if not all(key in rubric for key in required_keys):
-            missing = required_keys - set(rubric.keys())
-            return False, f"Missing required keys: {missing}"
+    return True, None
 
-        # Validate criteria
-        if not isinstance(rubric["criteria"], list) or len(rubric["criteria"]) == 0:
-            return False, "criteria must be a non-empty list"
 
-        seen_ids = set()
-        total_weight = 0.0
-        for i, criterion in enumerate(rubric["criteria"]):
-            # Check required fields
-            required_fields = {"id", "label", "desc", "weight"}
-            if not all(field in criterion for field in required_fields):
-                missing = required_fields - set(criterion.keys())
-                return False, f"Criterion {i} missing required fields: {missing}"
+def _validate_old_format(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate the legacy (flat criteria) portion of a rubric."""
+    if not _REQ_TOP_OLD.issubset(rubric.keys()):
+        missing = _REQ_TOP_OLD - rubric.keys()
+        return False, f"Missing required keys: {missing}"
 
-            # Check for duplicate IDs
-            if criterion["id"] in seen_ids:
-                return False, f"Duplicate criterion ID: {criterion['id']}"
-            seen_ids.add(criterion["id"])
+    # Validate criteria
+    if not isinstance(rubric["criteria"], list) or len(rubric["criteria"]) == 0:
+        return False, "criteria must be a non-empty list"
 
-            # Check weight is a number
-            try:
-                weight = float(criterion["weight"])
-                if weight < 0 or weight > 1:
-                    return False, f"Criterion '{criterion['id']}' weight must be between 0 and 1"
-                total_weight += weight
-            except (TypeError, ValueError):
-                return False, f"Criterion '{criterion['id']}' weight must be a number"
+    seen_ids = set()
+    total_weight = 0.0
+    for i, criterion in enumerate(rubric["criteria"]):
+        # Check required fields
+        if not _REQ_OLD_CRITERION.issubset(criterion.keys()):
+            missing = _REQ_OLD_CRITERION - criterion.keys()
+            return False, f"Criterion {i} missing required fields: {missing}"
+
+        # Check for duplicate IDs
+        if criterion["id"] in seen_ids:
+            return False, f"Duplicate criterion ID: {criterion['id']}"
+        seen_ids.add(criterion["id"])
+
+        # Check weight is a number
+        try:
+            weight = float(criterion["weight"])
+            if weight < 0 or weight > 1:
+                return False, f"Criterion '{criterion['id']}' weight must be between 0 and 1"
+            total_weight += weight
+        except (TypeError, ValueError):
+            return False, f"Criterion '{criterion['id']}' weight must be a number"
+
+    # Check weights sum to approximately 1.0 (allow small floating point errors)
+    if not (0.99 <= total_weight <= 1.01):
+        return False, f"Criterion weights must sum to 1.0 (current sum: {total_weight:.4f})"
+
+    return True, None
 
-        # Check weights sum to approximately 1.0 (allow small floating point errors)
-        if not (0.99 <= total_weight <= 1.01):
-            return False, f"Criterion weights must sum to 1.0 (current sum: {total_weight:.4f})"
 
+def _validate_scale_and_thresholds(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate the scale and thresholds blocks shared by both formats."""
     # Validate scale (common to both formats)
     if not isinstance(rubric["scale"], dict):
         return False, "scale must be a dict"
@@ -208,9 +310,14 @@ def validate_rubric(rubric: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+# Bound once at import: every load/save/list call goes through this path and
+# rebuilding it allocated fresh Path objects each time
+_RUBRICS_DIR = Path(__file__).parent / "rubrics"
+
+
 def get_rubrics_dir() -> Path:
     """Get the rubrics directory path."""
-    return Path(__file__).parent / "rubrics"
+    return _RUBRICS_DIR
 
 
 def load_rubric_from_file(filename: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
@@ -222,8 +329,7 @@ def load_rubric_from_file(filename: str) -> Tuple[Optional[Dict[str, Any]], Opti
         return None, f"Rubric file not found: {rubric_path}"
 
     try:
-        with open(rubric_path, 'r') as f:
-            rubric = json.load(f)
+        rubric = _loads(rubric_path.read_bytes())
         return rubric, None
     except json.JSONDecodeError as e:
         return None, f"Invalid JSON in {rubric_path}: {e}"
@@ -246,42 +352,37 @@ def save_rubric_to_file(rubric: Dict[str, Any], filename: str, create_backup: bo
             versions_dir.mkdir(exist_ok=True)
 
             # Get current timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
 
-            # Load current rubric to get version info
+            # Read the current rubric once; the same parse supplies the
+            # version for the backup name and the dict we archive, instead
+            # of copy2 followed by a reload-mutate-rewrite of the copy
+            current_rubric = None
             try:
-                with open(rubric_path, 'r') as f:
-                    current_rubric = json.load(f)
+                current_rubric = _loads(rubric_path.read_bytes())
                 current_version = current_rubric.get('version', '1.0')
-            except:
+            except Exception:
                 current_version = 'unknown'
 
             # Create backup filename
             backup_filename = f"{filename}.v{current_version}.{timestamp}.json"
             backup_path = versions_dir / backup_filename
 
-            # Copy current file to backup
-            import shutil
-            shutil.copy2(rubric_path, backup_path)
-            
-            # Mark the backup as archived
-            try:
-                with open(backup_path, 'r') as f:
-                    backup_rubric = json.load(f)
-                backup_rubric['status'] = 'archive'
-                with open(backup_path, 'w') as f:
-                    json.dump(backup_rubric, f, indent=2)
+            if current_rubric is not None:
+                # Mark the backup as archived and write it in one pass
+                current_rubric['status'] = 'archive'
+                backup_path.write_bytes(_dumps(current_rubric))
                 print(f"💾 Backup created: {backup_filename} (status: archive)")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not mark backup as archived: {e}")
+            else:
+                # Unparseable source: preserve the bytes verbatim
+                backup_path.write_bytes(rubric_path.read_bytes())
+                print("⚠️  Warning: Could not mark backup as archived: source is not valid JSON")
 
         except Exception as e:
             print(f"⚠️  Warning: Could not create backup: {e}")
 
     try:
-        with open(rubric_path, 'w') as f:
-            json.dump(rubric, f, indent=2)
+        rubric_path.write_bytes(_dumps(rubric))
         return True, None
     except Exception as e:
         return False, f"Error saving to {rubric_path}: {e}"
@@ -289,45 +390,95 @@ def save_rubric_to_file(rubric: Dict[str, Any], filename: str, create_backup: bo
 
 def increment_version(current_version: str) -> str:
     """Increment a version string (e.g., '1.0' -> '1.1', '2.5' -> '2.6')."""
+    # One rpartition call instead of split()'s list allocation; a missing
+    # dot or non-numeric minor falls back to appending '.1' as before
+    major, sep, minor = current_version.rpartition('.')
+    if sep and minor.isdigit():
+        return f"{major}.{int(minor) + 1}"
+    return f"{current_version}.1"
+
+
+def _load_listing_manifest(cache_path: Path) -> Dict[str, Any]:
+    """Load the on-disk listing manifest; an unreadable cache means empty."""
     try:
-        # Split version into parts
-        parts = current_version.split('.')
-        if len(parts) >= 2:
-            # Increment minor version
-            major = parts[0]
-            minor = str(int(parts[1]) + 1)
-            return f"{major}.{minor}"
-        else:
-            # If no minor version, add .1
-            return f"{current_version}.1"
-    except (ValueError, IndexError):
-        # If parsing fails, append .1
-        return f"{current_version}.1"
+        return _loads(cache_path.read_bytes())
+    except Exception:
+        return {}
+
+
+# In-process layer over the on-disk manifest, keyed the same way; a warm
+# process serves repeat listings from stat calls alone, without even
+# re-reading the manifest file
+_LISTING_MEMO: Dict[str, Dict[str, str]] = {}
 
 
 def list_available_rubrics() -> List[Dict[str, str]]:
-    """List all available rubrics in the rubrics directory."""
+    """List all available rubrics in the rubrics directory.
+
+    Listing entries are cached on disk in rubrics/.cache/listing.json keyed
+    by (name, mtime_ns, size), so unchanged files are served from the
+    manifest with a stat call instead of an open+parse+validate pass.
+    """
     rubrics_dir = get_rubrics_dir()
     available = []
 
     if rubrics_dir.exists():
+        cache_path = rubrics_dir / ".cache" / "listing.json"
+        manifest = None  # read lazily, only when the in-process memo misses
+        new_manifest = {}
+        dirty = False
+
         for rubric_file in sorted(rubrics_dir.glob("*.json")):
             try:
-                with open(rubric_file, 'r') as f:
-                    rubric_data = json.load(f)
-
-                # Validate before adding to list
-                is_valid, _ = validate_rubric(rubric_data)
-                # Only include rubrics marked as current
-                if is_valid and rubric_data.get('status') == 'current':
-                    available.append({
-                        'filename': rubric_file.stem,
-                        'name': rubric_data.get('name', rubric_file.stem),
-                        'description': rubric_data.get('description', 'No description available')
-                    })
+                stat_result = rubric_file.stat()
+                key = f"{rubric_file.name}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+                entry = _LISTING_MEMO.get(key)
+                if entry is None:
+                    if manifest is None:
+                        manifest = _load_listing_manifest(cache_path)
+                    entry = manifest.get(key)
+                if entry is None:
+                    dirty = True
+                    raw = rubric_file.read_bytes()
+                    rubric_data = _loads(raw)
+
+                    # Validate before adding to list (memoized on file content)
+                    is_valid, _ = _validate_raw(raw, rubric_data)
+                    # Only include rubrics marked as current; an empty dict
+                    # records a known-but-unlistable file in the manifest
+                    if is_valid and rubric_data.get('status') == 'current':
+                        entry = {
+                            'filename': rubric_file.stem,
+                            'name': rubric_data.get('name', rubric_file.stem),
+                            'description': rubric_data.get('description', 'No description available')
+                        }
+                    else:
+                        entry = {}
+                _LISTING_MEMO[key] = entry
+                new_manifest[key] = entry
+                if entry:
+                    available.append(dict(entry))
             except (json.JSONDecodeError, Exception):
                 continue
 
+        if dirty or (manifest is not None and len(new_manifest) != len(manifest)):
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                cache_path.write_bytes(_dumps(new_manifest))
+            except Exception:
+                pass  # a read-only rubrics dir just means no persistent cache
+
+    # Handle duplicate names by appending filename in parentheses, so UI
+    # dropdowns keyed on 'name' keep every rubric selectable (same behaviour
+    # as src.video_evaluator.list_available_rubrics); the appended entries
+    # are copies, so the memoized listing stays untouched
+    seen_names = set()
+    for rubric in available:
+        original_name = rubric['name']
+        while rubric['name'] in seen_names:
+            rubric['name'] = f"{original_name} ({rubric['filename']})"
+        seen_names.add(rubric['name'])
+
     # Ensure sample rubric is always available
     if not any(r['filename'] == 'sample-rubric' for r in available):
         available.insert(0, {
@@ -354,8 +505,7 @@ def list_rubric_versions(filename: str) -> List[Dict[str, str]]:
     current_path = rubrics_dir / f"{filename}.json"
     if current_path.exists():
         try:
-            with open(current_path, 'r') as f:
-                rubric = json.load(f)
+            rubric = _loads(current_path.read_bytes())
             versions.append({
                 'version': rubric.get('version', '1.0'),
                 'filename': f"{filename}.json",
@@ -365,29 +515,25 @@ def list_rubric_versions(filename: str) -> List[Dict[str, str]]:
         except:
             pass
 
-    # Add backup versions
-    if versions_dir.exists():
-        for backup_file in sorted(versions_dir.glob(f"{filename}.v*.json"), reverse=True):
-            try:
-                # Parse version and timestamp from filename
-                # Format: filename.v{major}.{minor}.{timestamp}.json
-                parts = backup_file.stem.split('.')
-                if len(parts) >= 4 and parts[1].startswith('v'):
-                    version_part = parts[1][1:]  # Remove 'v' prefix from parts[1] (major version)
-                    minor_version = parts[2]     # parts[2] is minor version
-                    timestamp = parts[3]         # parts[3] is timestamp
-                    
-                    # Construct version string
-                    version = f"{version_part}.{minor_version}"
-                    
-                    versions.append({
-                        'version': version,
-                        'filename': backup_file.name,
-                        'type': 'backup',
-                        'timestamp': timestamp
-                    })
-            except:
-                continue
+    # Add backup versions: scandir + one compiled regex per name instead of
+    # Path.glob's fnmatch pass and a split-based parse
+    try:
+        backup_names = [entry.name for entry in os.scandir(versions_dir)]
+    except (FileNotFoundError, NotADirectoryError):
+        backup_names = []
+
+    pattern = _version_pattern(filename)
+    for backup_name in sorted(backup_names, reverse=True):
+        # Format: filename.v{major}.{minor}.{timestamp}.json
+        match = pattern.match(backup_name)
+        if not match:
+            continue
+        versions.append({
+            'version': f"{match.group(1)}.{match.group(2)}",
+            'filename': backup_name,
+            'type': 'backup',
+            'timestamp': match.group(3)
+        })
 
     return versions
 
@@ -399,28 +545,45 @@ def restore_rubric_version(filename: str, version: str) -> Tuple[bool, Optional[
 
     # Find the backup file for this version
     backup_path = None
-    for backup_file in versions_dir.glob(f"{filename}.v{version}.*.json"):
-        backup_path = backup_file
-        break
+    prefix = f"{filename}.v{version}."
+    try:
+        for entry in os.scandir(versions_dir):
+            if entry.name.startswith(prefix) and entry.name.endswith('.json'):
+                backup_path = versions_dir / entry.name
+                break
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
     if not backup_path:
         return False, f"No backup found for version {version}"
 
     # Load the backup
     try:
-        with open(backup_path, 'r') as f:
-            rubric = json.load(f)
+        raw = backup_path.read_bytes()
     except Exception as e:
         return False, f"Error loading backup: {e}"
 
-    # Ensure the restored rubric has current status
-    rubric['status'] = 'current'
+    # Ensure the restored rubric has current status. Backups are written by
+    # this module, so when the serialized bytes contain exactly one status
+    # field it must be the top-level one and can be patched in place -
+    # preserving formatting and skipping the parse/serialize round trip.
+    # Zero matches (no status field) or several (nested status fields on
+    # categories/criteria) fall back to parse + inject, so the byte patch
+    # can never touch the wrong field.
+    if len(_STATUS_RE.findall(raw)) == 1:
+        patched = _STATUS_RE.sub(b'"status": "current"', raw, count=1)
+    else:
+        try:
+            rubric = _loads(raw)
+        except Exception as e:
+            return False, f"Error loading backup: {e}"
+        rubric['status'] = 'current'
+        patched = _dumps(rubric)
 
     # Save as current version (without creating another backup)
     current_path = rubrics_dir / f"{filename}.json"
     try:
-        with open(current_path, 'w') as f:
-            json.dump(rubric, f, indent=2)
+        current_path.write_bytes(patched)
         return True, None
     except Exception as e:
         return False, f"Error restoring: {e}"
@@ -482,6 +645,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
     print("- Nested Criteria (evaluation items within the category)")
 
     categories = []
+    category_ids = set()
     total_weight = 0.0
 
     while True:
@@ -494,7 +658,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
             category_id = input("Category ID (letters/numbers/underscores only): ").strip().lower().replace(' ', '_')
 
         # Check for duplicate category IDs
-        if any(c['category_id'] == category_id for c in categories):
+        if category_id in category_ids:
             print(f"❌ Category ID '{category_id}' already exists. Choose a different ID.")
             continue
 
@@ -534,6 +698,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
 
         # Add criteria for this category
         criteria = []
+        criterion_ids = set()
         criteria_total_points = 0
         print(f"\nAdding criteria for category '{category_label}'")
         
@@ -547,7 +712,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
                 criterion_id = input("  Criterion ID (letters/numbers/underscores only): ").strip().lower().replace(' ', '_')
 
             # Check for duplicate criterion IDs within this category
-            if any(c['criterion_id'] == criterion_id for c in criteria):
+            if criterion_id in criterion_ids:
                 print(f"❌ Criterion ID '{criterion_id}' already exists in this category.")
                 continue
 
@@ -578,6 +743,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
                 'desc': crit_desc,
                 'max_points': crit_max_points
             })
+            criterion_ids.add(criterion_id)
 
             criteria_total_points += crit_max_points
             print(f"✓ Added criterion. Category points so far: {criteria_total_points}")
@@ -599,6 +765,7 @@ def create_rubric_interactive() -> Dict[str, Any]:
             'max_points': category_max_points,
             'criteria': criteria
         })
+        category_ids.add(category_id)
 
         total_weight += category_weight
         print(f"✓ Added category. Total weight so far: {total_weight:.3f}")
@@ -641,38 +808,45 @@ def create_rubric_interactive() -> Dict[str, Any]:
 
 def show_rubric_details(rubric: Dict[str, Any]):
     """Display detailed information about a rubric."""
-    print(f"📋 {rubric['name']}")
-    print("=" * 50)
-    print(f"Description: {rubric['description']}")
-    
+    # Rebind repeated subscripts to locals once; the f-strings below then
+    # use LOAD_FAST instead of a dict hash lookup per reference
+    scale = rubric['scale']
+    thresholds = rubric['thresholds']
+    out = []
+
+    out.append(f"📋 {rubric['name']}")
+    out.append("=" * 50)
+    out.append(f"Description: {rubric['description']}")
+
     # Check if new format (has categories) or old format (has criteria)
     is_new_format = "categories" in rubric
-    
+
     if is_new_format:
-        print(f"Version: {rubric.get('version', '1.0')}")
-        print(f"Rubric ID: {rubric.get('rubric_id', 'unknown')}")
-    
-    print(f"Scale: {rubric['scale']['min']}-{rubric['scale']['max']}")
-    print(f"Overall Method: {rubric['overall_method']}")
-    print(f"Pass Threshold: ≥{rubric['thresholds']['pass']}")
-    print(f"Revise Threshold: ≥{rubric['thresholds']['revise']}")
+        out.append(f"Version: {rubric.get('version', '1.0')}")
+        out.append(f"Rubric ID: {rubric.get('rubric_id', 'unknown')}")
+
+    out.append(f"Scale: {scale['min']}-{scale['max']}")
+    out.append(f"Overall Method: {rubric['overall_method']}")
+    out.append(f"Pass Threshold: ≥{thresholds['pass']}")
+    out.append(f"Revise Threshold: ≥{thresholds['revise']}")
 
     if is_new_format:
         # New format: categories with nested criteria
-        total_categories = len(rubric['categories'])
-        total_criteria = sum(len(cat['criteria']) for cat in rubric['categories'])
-        print(f"\n� Categories ({total_categories}) with Criteria ({total_criteria} total):")
-        print("-" * 50)
+        categories = rubric['categories']
+        total_categories = len(categories)
+        total_criteria = sum(len(cat['criteria']) for cat in categories)
+        out.append(f"\n� Categories ({total_categories}) with Criteria ({total_criteria} total):")
+        out.append("-" * 50)
         
-        for cat in rubric['categories']:
+        for cat in categories:
             cat_name = cat['label']
             cat_id = cat['category_id']
             cat_weight = cat.get('weight', 0) * 100
             cat_max_points = cat['max_points']
             
-            print(f"📂 {cat_name} ({cat_id})")
-            print(f"   Weight: {cat_weight:.1f}% | Max Points: {cat_max_points}")
-            print(f"   Criteria:")
+            out.append(f"📂 {cat_name} ({cat_id})")
+            out.append(f"   Weight: {cat_weight:.1f}% | Max Points: {cat_max_points}")
+            out.append(f"   Criteria:")
             
             for criterion in cat['criteria']:
                 crit_name = criterion['label']
@@ -680,25 +854,29 @@ def show_rubric_details(rubric: Dict[str, Any]):
                 crit_max_points = criterion['max_points']
                 crit_desc = criterion.get('desc', '')
                 
-                print(f"     • {crit_name} ({crit_id}) - {crit_max_points} points")
+                out.append(f"     • {crit_name} ({crit_id}) - {crit_max_points} points")
                 if crit_desc:
-                    print(f"       {crit_desc}")
-            print()
+                    out.append(f"       {crit_desc}")
+            out.append('')
     else:
         # Old format: flat criteria array
-        print(f"\n�📊 Criteria ({len(rubric['criteria'])} total):")
-        print("-" * 50)
+        criteria = rubric['criteria']
+        out.append(f"\n�📊 Criteria ({len(criteria)} total):")
+        out.append("-" * 50)
 
         total_weight = 0.0
-        for i, criterion in enumerate(rubric['criteria'], 1):
+        for i, criterion in enumerate(criteria, 1):
             weight_pct = criterion['weight'] * 100
-            print(f"{i}. {criterion['label']} ({criterion['id']})")
-            print(f"   Weight: {weight_pct:.1f}%")
-            print(f"   Description: {criterion['desc']}")
-            print()
+            out.append(f"{i}. {criterion['label']} ({criterion['id']})")
+            out.append(f"   Weight: {weight_pct:.1f}%")
+            out.append(f"   Description: {criterion['desc']}")
+            out.append('')
             total_weight += criterion['weight']
 
-        print(f"Total Weight: {total_weight:.3f} (should be 1.0)")
+        out.append(f"Total Weight: {total_weight:.3f} (should be 1.0)")
+
+    # One encoded write instead of a stdout lock/flush per line
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def edit_rubric_interactive(filename: str):
@@ -721,6 +899,10 @@ def edit_rubric_interactive(filename: str):
     # Check if new format (has categories) or old format (has criteria)
     is_new_format = "categories" in rubric
 
+    # Fingerprint before edits so a no-op session (Enter at every prompt)
+    # skips validation, the version bump, and the file rewrite
+    orig_fingerprint = _canonical(rubric)
+
     print("\n🔧 What would you like to edit?")
     if is_new_format:
         print("1. Basic info (name, description, version)")
@@ -758,22 +940,24 @@ def edit_rubric_interactive(filename: str):
     elif choice == '2':
         # Edit scale and thresholds
         print("\n📏 Editing scale and thresholds")
+        scale = rubric['scale']
+        thresholds = rubric['thresholds']
         try:
-            min_val = input(f"Min score [{rubric['scale']['min']}]: ").strip()
+            min_val = input(f"Min score [{scale['min']}]: ").strip()
             if min_val:
-                rubric['scale']['min'] = int(min_val)
+                scale['min'] = int(min_val)
 
-            max_val = input(f"Max score [{rubric['scale']['max']}]: ").strip()
+            max_val = input(f"Max score [{scale['max']}]: ").strip()
             if max_val:
-                rubric['scale']['max'] = int(max_val)
+                scale['max'] = int(max_val)
 
-            pass_thresh = input(f"Pass threshold [{rubric['thresholds']['pass']}]: ").strip()
+            pass_thresh = input(f"Pass threshold [{thresholds['pass']}]: ").strip()
             if pass_thresh:
-                rubric['thresholds']['pass'] = int(pass_thresh)
+                thresholds['pass'] = int(pass_thresh)
 
-            revise_thresh = input(f"Revise threshold [{rubric['thresholds']['revise']}]: ").strip()
+            revise_thresh = input(f"Revise threshold [{thresholds['revise']}]: ").strip()
             if revise_thresh:
-                rubric['thresholds']['revise'] = int(revise_thresh)
+                thresholds['revise'] = int(revise_thresh)
 
         except ValueError as e:
             print(f"❌ Invalid input: {e}")
@@ -783,11 +967,12 @@ def edit_rubric_interactive(filename: str):
         if is_new_format:
             # Add new category
             print("\n➕ Adding new category")
+            existing_cat_ids = {c['category_id'] for c in rubric['categories']}
             category_id = input("Category ID (e.g., content_quality): ").strip().lower().replace(' ', '_')
             while not category_id or not category_id.replace('_', '').isalnum():
                 category_id = input("Category ID (letters/numbers/underscores only): ").strip().lower().replace(' ', '_')
 
-            if any(c['category_id'] == category_id for c in rubric['categories']):
+            if category_id in existing_cat_ids:
                 print(f"❌ Category ID '{category_id}' already exists.")
                 return
 
@@ -815,13 +1000,14 @@ def edit_rubric_interactive(filename: str):
 
             # Add criteria for this category
             criteria = []
+            criterion_ids = set()
             print(f"\nAdding criteria for category '{label}'")
             while True:
                 criterion_id = input("Criterion ID (e.g., technical_accuracy): ").strip().lower().replace(' ', '_')
                 while not criterion_id or not criterion_id.replace('_', '').isalnum():
                     criterion_id = input("Criterion ID (letters/numbers/underscores only): ").strip().lower().replace(' ', '_')
 
-                if any(c['criterion_id'] == criterion_id for c in criteria):
+                if criterion_id in criterion_ids:
                     print(f"❌ Criterion ID '{criterion_id}' already exists in this category.")
                     continue
 
@@ -848,6 +1034,7 @@ def edit_rubric_interactive(filename: str):
                     'desc': crit_desc,
                     'max_points': crit_max_points
                 })
+                criterion_ids.add(criterion_id)
 
                 if input("Add another criterion to this category? (Y/n): ").lower().startswith('n'):
                     break
@@ -863,7 +1050,7 @@ def edit_rubric_interactive(filename: str):
             # Add new criterion (old format)
             print("\n➕ Adding new criterion")
             criterion_id = input("ID: ").strip().lower().replace(' ', '_')
-            if any(c['id'] == criterion_id for c in rubric['criteria']):
+            if criterion_id in {c['id'] for c in rubric['criteria']}:
                 print(f"❌ ID '{criterion_id}' already exists.")
                 return
 
@@ -890,19 +1077,20 @@ def edit_rubric_interactive(filename: str):
         if is_new_format:
             # Edit existing categories/criteria
             print("\n📝 Editing existing categories and criteria")
-            for i, category in enumerate(rubric['categories'], 1):
+            categories = rubric['categories']
+            for i, category in enumerate(categories, 1):
                 print(f"{i}. {category['label']} ({category['category_id']}) - {len(category['criteria'])} criteria")
 
             try:
                 cat_idx = int(input("\nCategory number to edit: ").strip()) - 1
-                if not (0 <= cat_idx < len(rubric['categories'])):
+                if not (0 <= cat_idx < len(categories)):
                     print("❌ Invalid category number")
                     return
             except ValueError:
                 print("❌ Invalid number")
                 return
 
-            category = rubric['categories'][cat_idx]
+            category = categories[cat_idx]
             print(f"\nEditing Category: {category['label']}")
 
             # Edit category details
@@ -925,16 +1113,17 @@ def edit_rubric_interactive(filename: str):
                 print("❌ Invalid max points")
 
             # Edit criteria within this category
+            crits = category['criteria']
             print(f"\nCriteria in '{category['label']}' category:")
-            for j, criterion in enumerate(category['criteria'], 1):
+            for j, criterion in enumerate(crits, 1):
                 print(f"  {j}. {criterion['label']} ({criterion['criterion_id']}) - {criterion['max_points']} points")
 
             crit_choice = input("\nEdit a criterion? (number or 'n' to skip): ").strip()
             if crit_choice.isdigit():
                 try:
                     crit_idx = int(crit_choice) - 1
-                    if 0 <= crit_idx < len(category['criteria']):
-                        criterion = category['criteria'][crit_idx]
+                    if 0 <= crit_idx < len(crits):
+                        criterion = crits[crit_idx]
                         print(f"\nEditing Criterion: {criterion['label']}")
 
                         new_crit_label = input(f"Criterion Label [{criterion['label']}]: ").strip()
@@ -956,19 +1145,20 @@ def edit_rubric_interactive(filename: str):
         else:
             # Edit existing criteria (old format)
             print("\n📝 Editing existing criteria")
-            for i, criterion in enumerate(rubric['criteria'], 1):
+            criteria = rubric['criteria']
+            for i, criterion in enumerate(criteria, 1):
                 print(f"{i}. {criterion['label']} ({criterion['id']}) - {criterion['weight']:.3f}")
 
             try:
                 idx = int(input("\nCriterion number to edit: ").strip()) - 1
-                if not (0 <= idx < len(rubric['criteria'])):
+                if not (0 <= idx < len(criteria)):
                     print("❌ Invalid criterion number")
                     return
             except ValueError:
                 print("❌ Invalid number")
                 return
 
-            criterion = rubric['criteria'][idx]
+            criterion = criteria[idx]
             print(f"\nEditing: {criterion['label']}")
 
             new_label = input(f"Label [{criterion['label']}]: ").strip()
@@ -990,36 +1180,38 @@ def edit_rubric_interactive(filename: str):
         if is_new_format:
             # Remove category
             print("\n🗑️ Removing category")
-            for i, category in enumerate(rubric['categories'], 1):
+            categories = rubric['categories']
+            for i, category in enumerate(categories, 1):
                 print(f"{i}. {category['label']} ({category['category_id']}) - {len(category['criteria'])} criteria")
 
             try:
                 idx = int(input("\nCategory number to remove: ").strip()) - 1
-                if not (0 <= idx < len(rubric['categories'])):
+                if not (0 <= idx < len(categories)):
                     print("❌ Invalid category number")
                     return
             except ValueError:
                 print("❌ Invalid number")
                 return
 
-            removed = rubric['categories'].pop(idx)
+            removed = categories.pop(idx)
             print(f"✓ Removed category: {removed['label']}")
         else:
             # Remove criterion (old format)
             print("\n🗑️ Removing criterion")
-            for i, criterion in enumerate(rubric['criteria'], 1):
+            criteria = rubric['criteria']
+            for i, criterion in enumerate(criteria, 1):
                 print(f"{i}. {criterion['label']} ({criterion['id']}) - {criterion['weight']:.3f}")
 
             try:
                 idx = int(input("\nCriterion number to remove: ").strip()) - 1
-                if not (0 <= idx < len(rubric['criteria'])):
+                if not (0 <= idx < len(criteria)):
                     print("❌ Invalid criterion number")
                     return
             except ValueError:
                 print("❌ Invalid number")
                 return
 
-            removed = rubric['criteria'].pop(idx)
+            removed = criteria.pop(idx)
             print(f"✓ Removed: {removed['label']}")
 
     elif choice == '6':
@@ -1029,6 +1221,10 @@ def edit_rubric_interactive(filename: str):
         print("❌ Invalid choice.")
         return
 
+    if _canonical(rubric) == orig_fingerprint:
+        print("ℹ️ No changes made; rubric left untouched.")
+        return
+
     # Validate the edited rubric
     is_valid, error = validate_rubric(rubric)
     if not is_valid:
@@ -1051,151 +1247,193 @@ def edit_rubric_interactive(filename: str):
         print(f"❌ Error saving rubric: {error}")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
+def _cmd_create(args):
+    """Create a rubric interactively, validate it, and save it."""
+    rubric = create_rubric_interactive()
+
+    # Validate
+    is_valid, error = validate_rubric(rubric)
+    if not is_valid:
+        print(f"❌ Validation failed: {error}")
         sys.exit(1)
 
-    command = sys.argv[1].lower()
+    # Get filename
+    filename = input("\n💾 Filename (without .json): ").strip()
+    while not filename:
+        filename = input("Filename (required): ").strip()
 
-    if command == 'create':
-        rubric = create_rubric_interactive()
+    # Save
+    success, error = save_rubric_to_file(rubric, filename)
+    if success:
+        print(f"✓ Rubric saved as '{filename}.json'")
+        print("\nTo use this rubric:")
+        print(f"  CLI: python cli/evaluate_video.py --rubric {filename} <video>")
+        print(f"  Code: VideoEvaluator(rubric_name='{filename}')")
+    else:
+        print(f"❌ Error saving: {error}")
 
-        # Validate
-        is_valid, error = validate_rubric(rubric)
-        if not is_valid:
-            print(f"❌ Validation failed: {error}")
-            sys.exit(1)
 
-        # Get filename
-        filename = input("\n💾 Filename (without .json): ").strip()
-        while not filename:
-            filename = input("Filename (required): ").strip()
-
-        # Save
-        success, error = save_rubric_to_file(rubric, filename)
-        if success:
-            print(f"✓ Rubric saved as '{filename}.json'")
-            print("\nTo use this rubric:")
-            print(f"  CLI: python cli/evaluate_video.py --rubric {filename} <video>")
-            print(f"  Code: VideoEvaluator(rubric_name='{filename}')")
-        else:
-            print(f"❌ Error saving: {error}")
+def _cmd_validate(args):
+    """Validate a rubric file and report the result."""
+    filename = args.filename
 
-    elif command == 'validate':
-        if len(sys.argv) < 3:
-            print("❌ Usage: python rubric_helper.py validate <filename>")
-            sys.exit(1)
+    # Handle both relative paths and filenames
+    if filename.startswith('rubrics/'):
+        # Remove rubrics/ prefix if present
+        filename = filename[8:]  # Remove 'rubrics/' prefix
 
-        filename = sys.argv[2]
-        
-        # Handle both relative paths and filenames
-        if filename.startswith('rubrics/'):
-            # Remove rubrics/ prefix if present
-            filename = filename[8:]  # Remove 'rubrics/' prefix
-        
-        if not filename.endswith('.json'):
-            filename += '.json'
+    if not filename.endswith('.json'):
+        filename += '.json'
 
-        rubric_path = get_rubrics_dir() / filename
+    rubric_path = get_rubrics_dir() / filename
 
-        try:
-            with open(rubric_path, 'r') as f:
-                rubric = json.load(f)
-        except FileNotFoundError:
-            print(f"❌ File not found: {rubric_path}")
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON: {e}")
-            sys.exit(1)
+    try:
+        # _loads picks the orjson C parser when available; orjson's
+        # JSONDecodeError subclasses json's, so the except still matches
+        rubric = _loads(rubric_path.read_bytes())
+    except FileNotFoundError:
+        print(f"❌ File not found: {rubric_path}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"❌ Invalid JSON: {e}")
+        sys.exit(1)
 
-        is_valid, error = validate_rubric(rubric)
-        if is_valid:
-            print(f"✓ Rubric '{filename}' is valid!")
-        else:
-            print(f"❌ Rubric '{filename}' is invalid:")
-            print(f"   {error}")
-            sys.exit(1)
+    is_valid, error = validate_rubric(rubric)
+    if is_valid:
+        print(f"✓ Rubric '{filename}' is valid!")
+    else:
+        print(f"❌ Rubric '{filename}' is invalid:")
+        print(f"   {error}")
+        sys.exit(1)
 
-    elif command == 'list':
-        rubrics = list_available_rubrics()
-        if not rubrics:
-            print("❌ No rubrics found.")
-            sys.exit(1)
 
-        print("📋 Available Rubrics:")
-        print("=" * 50)
-        for rubric in rubrics:
-            print(f"• {rubric['filename']}: {rubric['name']}")
-            print(f"  {rubric['description']}")
-            print()
+def _cmd_list(args):
+    """List all available rubrics."""
+    rubrics = list_available_rubrics()
+    if not rubrics:
+        print("❌ No rubrics found.")
+        sys.exit(1)
 
-    elif command == 'show':
-        if len(sys.argv) < 3:
-            print("❌ Usage: python rubric_helper.py show <rubric_name>")
-            sys.exit(1)
+    print("📋 Available Rubrics:")
+    print("=" * 50)
+    for rubric in rubrics:
+        print(f"• {rubric['filename']}: {rubric['name']}")
+        print(f"  {rubric['description']}")
+        print()
 
-        rubric_name = sys.argv[2]
-        rubric, error = load_rubric_from_file(rubric_name)
-        if error:
-            print(f"❌ Error: {error}")
-            sys.exit(1)
 
-        if rubric is None:
-            print(f"❌ Rubric '{rubric_name}' not found.")
-            sys.exit(1)
+def _cmd_show(args):
+    """Show the details of one rubric."""
+    rubric, error = load_rubric_from_file(args.rubric_name)
+    if error:
+        print(f"❌ Error: {error}")
+        sys.exit(1)
 
-        show_rubric_details(rubric)
+    if rubric is None:
+        print(f"❌ Rubric '{args.rubric_name}' not found.")
+        sys.exit(1)
 
-    elif command == 'edit':
-        if len(sys.argv) < 3:
-            print("❌ Usage: python rubric_helper.py edit <rubric_name>")
-            sys.exit(1)
+    show_rubric_details(rubric)
 
-        rubric_name = sys.argv[2]
-        edit_rubric_interactive(rubric_name)
 
-    elif command == 'versions':
-        if len(sys.argv) < 3:
-            print("❌ Usage: python rubric_helper.py versions <rubric_name>")
-            sys.exit(1)
+def _cmd_edit(args):
+    """Edit an existing rubric interactively."""
+    edit_rubric_interactive(args.rubric_name)
 
-        rubric_name = sys.argv[2]
-        versions = list_rubric_versions(rubric_name)
 
-        if not versions:
-            print(f"❌ No versions found for rubric '{rubric_name}'.")
-            sys.exit(1)
+def _cmd_versions(args):
+    """List all stored versions of a rubric."""
+    versions = list_rubric_versions(args.rubric_name)
 
-        print(f"📋 Versions for rubric '{rubric_name}':")
-        print("=" * 60)
-        for version in versions:
-            type_indicator = "📄" if version['type'] == 'current' else "💾"
-            timestamp_info = "" if version['type'] == 'current' else f" ({version['timestamp']})"
-            print(f"{type_indicator} Version {version['version']}{timestamp_info}")
-            print(f"   File: {version['filename']}")
-            print()
-
-    elif command == 'restore':
-        if len(sys.argv) < 4:
-            print("❌ Usage: python rubric_helper.py restore <rubric_name> <version>")
-            sys.exit(1)
+    if not versions:
+        print(f"❌ No versions found for rubric '{args.rubric_name}'.")
+        sys.exit(1)
 
-        rubric_name = sys.argv[2]
-        version = sys.argv[3]
+    print(f"📋 Versions for rubric '{args.rubric_name}':")
+    print("=" * 60)
+    for version in versions:
+        type_indicator = "📄" if version['type'] == 'current' else "💾"
+        timestamp_info = "" if version['type'] == 'current' else f" ({version['timestamp']})"
+        print(f"{type_indicator} Version {version['version']}{timestamp_info}")
+        print(f"   File: {version['filename']}")
+        print()
 
-        success, error = restore_rubric_version(rubric_name, version)
-        if success:
-            print(f"✓ Rubric '{rubric_name}' restored to version {version}!")
-        else:
-            print(f"❌ Error restoring rubric: {error}")
-            sys.exit(1)
 
+def _cmd_restore(args):
+    """Restore a rubric to a previous version."""
+    success, error = restore_rubric_version(args.rubric_name, args.version)
+    if success:
+        print(f"✓ Rubric '{args.rubric_name}' restored to version {args.version}!")
     else:
-        print(f"❌ Unknown command: {command}")
+        print(f"❌ Error restoring rubric: {error}")
+        sys.exit(1)
+
+
+# Command-name -> handler table; parse_args + one dict lookup replaces the
+# old if/elif cascade over sys.argv
+_CLI_COMMANDS = {
+    'create': _cmd_create,
+    'validate': _cmd_validate,
+    'list': _cmd_list,
+    'show': _cmd_show,
+    'edit': _cmd_edit,
+    'versions': _cmd_versions,
+    'restore': _cmd_restore,
+}
+
+
+class _CLIParser(argparse.ArgumentParser):
+    """ArgumentParser whose errors keep this CLI's historical exit status 1."""
+
+    def error(self, message):
+        self.print_usage(sys.stderr)
+        sys.stderr.write(f"{self.prog}: error: {message}\n")
+        sys.exit(1)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    # Subparsers inherit _CLIParser, so their errors also exit 1
+    parser = _CLIParser(
+        prog='rubric_helper.py',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subs = parser.add_subparsers(dest='cmd')
+    subs.add_parser('create', help='Create a new rubric interactively')
+    sub = subs.add_parser('validate', help='Validate a rubric file')
+    sub.add_argument('filename')
+    subs.add_parser('list', help='List all available rubrics')
+    sub = subs.add_parser('show', help='Show details of a rubric')
+    sub.add_argument('rubric_name')
+    sub = subs.add_parser('edit', help='Edit an existing rubric')
+    sub.add_argument('rubric_name')
+    sub = subs.add_parser('versions', help='List all versions of a rubric')
+    sub.add_argument('rubric_name')
+    sub = subs.add_parser('restore', help='Restore rubric to a previous version')
+    sub.add_argument('rubric_name')
+    sub.add_argument('version')
+    return parser
+
+
+def main():
+    if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
 
+    # Commands were historically case-insensitive; keep that contract
+    argv = sys.argv[1:]
+    argv[0] = argv[0].lower()
+
+    # Preserve the documented unknown-command behaviour (usage docstring,
+    # exit 1) instead of argparse's invalid-choice message
+    if argv[0] not in _CLI_COMMANDS and argv[0] not in ('-h', '--help'):
+        print(f"❌ Unknown command: {argv[0]}")
+        print(__doc__)
+        sys.exit(1)
+
+    args = _build_parser().parse_args(argv)
+    _CLI_COMMANDS[args.cmd](args)
+
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -6,9 +6,36 @@ Reusable Streamlit components for displaying rubric validation results.
 Provides consistent validation UI across the application.
 """
 
+import json
+
 import streamlit as st
 from typing import Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from rubric_helper import validate_rubric
+
+
+def _canonical_bytes(rubric_data: Dict[str, Any]) -> bytes:
+    """Key-sorted JSON bytes; a deterministic cache key for a rubric dict."""
+    if orjson is not None:
+        return orjson.dumps(rubric_data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(rubric_data, sort_keys=True).encode()
+
+
+@st.cache_data(show_spinner=False)
+def _cached_validate(rubric_json: bytes) -> Tuple[bool, Optional[str]]:
+    """validate_rubric memoized on the serialized rubric content.
+
+    Streamlit reruns the page on every widget interaction; keying on the
+    canonical bytes means an unchanged rubric skips the full traversal.
+    """
+    rubric = orjson.loads(rubric_json) if orjson is not None else json.loads(rubric_json)
+    return validate_rubric(rubric)
+
 
 def display_validation_results(
     is_valid: bool,
@@ -53,8 +80,11 @@ def _display_validation_success(
         # Minimal success display for inline usage
         return
 
-    # Full detailed display for validation page
-    st.balloons()
+    # Full detailed display for validation page. The balloon animation is
+    # opt-in: it costs a multi-second client-side render pass, which stalls
+    # anyone validating several rubrics back to back.
+    if st.session_state.get('celebrate_validation', False):
+        st.balloons()
 
     if rubric_data:
         st.markdown("### Validation Results")
@@ -70,10 +100,15 @@ def _display_validation_success(
 
         # Structure details
         if "categories" in rubric_data:
+            # One pass over the categories instead of three generator sweeps
             categories = rubric_data['categories']
+            total_criteria = 0
+            total_weight = 0.0
+            for cat in categories:
+                total_criteria += len(cat['criteria'])
+                total_weight += cat.get('weight', 0)
             st.markdown(f"**Categories:** {len(categories)}")
-            st.markdown(f"**Total Criteria:** {sum(len(cat['criteria']) for cat in categories)}")
-            total_weight = sum(cat.get('weight', 0) for cat in categories)
+            st.markdown(f"**Total Criteria:** {total_criteria}")
             st.markdown(f"**Total Weight:** {total_weight:.3f} (should be 1.0)")
         else:
             criteria = rubric_data.get('criteria', [])
@@ -126,9 +161,7 @@ def validate_and_display(
     Returns:
         True if valid, False if invalid
     """
-    from rubric_helper import validate_rubric
-
-    is_valid, error_msg = validate_rubric(rubric_data)
+    is_valid, error_msg = _cached_validate(_canonical_bytes(rubric_data))
     display_validation_results(is_valid, error_msg, rubric_data, mode, rubric_name)
 
     return is_valid